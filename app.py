@@ -1,12 +1,39 @@
 # app.py (final, Render-ready)
 
-from flask import Flask, render_template, request, redirect, url_for, send_from_directory, jsonify
+# eventlet must patch the stdlib before anything else imports socket/threading
+import eventlet
+eventlet.monkey_patch()
+
+if __name__ == '__main__':
+    # Load this file once, as the `app` module, rather than a second time when APScheduler
+    # resolves stored 'app:publish_post' jobs; jobs added here then get that same reference
+    import app
+    app.main()
+    raise SystemExit
+
+from eventlet import tpool
+
+from flask import Flask, render_template, request, redirect, url_for, send_from_directory, jsonify, make_response, abort
+from flask_caching import Cache
 from flask_sqlalchemy import SQLAlchemy
-from flask_socketio import SocketIO
+from flask_sqlalchemy.session import Session
+from flask_socketio import SocketIO, join_room
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.base import STATE_STOPPED
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.executors.pool import ThreadPoolExecutor as APSThreadPool
+from sqlalchemy import create_engine, event, inspect, text, update, Delete, Insert, Update
+from sqlalchemy.pool import QueuePool, StaticPool
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+import mimetypes
 import os
+import shutil
+import tempfile
+import threading
+import sys
+import time
+import uuid
 from werkzeug.utils import secure_filename
 import logging
 
@@ -17,89 +44,388 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 app = Flask(__name__)
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///posts.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Pool for reads; writes go through the single write_engine connection below.
+# Pooled connections keep their PRAGMAs, so they are only set once per connection.
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'poolclass': QueuePool,
+    'pool_size': 10,
+    'max_overflow': 20,
+    'pool_pre_ping': True,
+    'pool_recycle': 1800,
+    'connect_args': {'check_same_thread': False},
+}
 app.config['UPLOAD_FOLDER'] = os.path.join(app.root_path, 'static', 'uploads')
+app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024  # Larger uploads are rejected with 413
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+# Behind nginx, point this at an internal location so nginx sends the image bytes itself:
+#   location /_uploads/ { internal; alias /app/static/uploads/; sendfile on; tcp_nopush on; }
+app.config['UPLOADS_ACCEL_REDIRECT'] = os.environ.get('UPLOADS_ACCEL_REDIRECT')
+# Apache/lighttpd equivalent: send_from_directory emits X-Sendfile instead of the file body
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE') == '1'
+
+class RoutingSession(Session):
+    """Session that sends flushes and INSERT/UPDATE/DELETE statements to write_engine."""
 
-db = SQLAlchemy(app)
-socketio = SocketIO(app)
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and (self._flushing or isinstance(clause, (Insert, Update, Delete))):
+            return write_engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+db = SQLAlchemy(app, session_options={'class_': RoutingSession})
+# A separate scheduler process can only reach browsers through a shared queue, e.g. redis://
+# (needs the redis package); unset, emits go straight to this process's clients.
+SOCKETIO_MESSAGE_QUEUE = os.environ.get('SOCKETIO_MESSAGE_QUEUE')
+socketio = SocketIO(app, async_mode='eventlet', message_queue=SOCKETIO_MESSAGE_QUEUE)
+# Rendered dashboard pages, keyed by the ETag of the post table
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': 10})
 
 # IST timezone for aware datetimes
 IST = timezone(timedelta(hours=5, minutes=30))
 
+# ---------- SQLite Tuning ----------
+# WAL lets the dashboard read while the scheduler writes; NORMAL sync is safe under WAL.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",  # The only lock timeout; it overrides sqlite3's connect(timeout=)
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
+
+def _enable_sqlite_wal(engine):
+    """Applies SQLITE_PRAGMAS to every new connection of a file-backed SQLite engine."""
+    if engine.url.get_backend_name() != "sqlite" or engine.url.database in (None, "", ":memory:"):
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+# ---------- Reader / Writer Engines ----------
+# SQLite only ever has one writer, so all writes share one connection behind a lock
+# instead of queueing on the database lock from every pooled connection.
+with app.app_context():
+    read_engine = db.engine
+    write_engine = create_engine(
+        read_engine.url, poolclass=StaticPool,
+        connect_args={'check_same_thread': False}
+    )
+    _enable_sqlite_wal(read_engine)
+    _enable_sqlite_wal(write_engine)
+_write_lock = threading.Lock()
+
+@contextmanager
+def _write_transaction():
+    """Holds the write lock while session changes are made, then commits them."""
+    with _write_lock:
+        try:
+            yield db.session
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
 # ---------- Database Model ----------
 class Post(db.Model):
+    # Serves the startup "scheduled" filter; status alone is covered by its leading column
+    __table_args__ = (db.Index('ix_post_status_time', 'status', 'scheduled_ts'),)
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     content = db.Column(db.Text, nullable=False)
     platform = db.Column(db.String(50), nullable=False)
-    scheduled_time = db.Column(db.DateTime, nullable=False)
+    scheduled_ts = db.Column(db.BigInteger, nullable=False, index=True)  # Unix seconds
     status = db.Column(db.String(20), default="scheduled")  # Changed "pending" to "scheduled" for consistency
     image_filename = db.Column(db.String(300), nullable=True)
 
+# One-row counter bumped by triggers on every post write, from any process or statement,
+# so the dashboard ETag is a primary-key lookup instead of an aggregate over the table
+POST_VERSION_DDL = (
+    "CREATE TABLE IF NOT EXISTS post_version (id INTEGER PRIMARY KEY CHECK (id = 1), version INTEGER NOT NULL)",
+    "INSERT OR IGNORE INTO post_version (id, version) VALUES (1, 0)",
+) + tuple(
+    f"CREATE TRIGGER IF NOT EXISTS post_version_{op.lower()} AFTER {op} ON post "
+    "BEGIN UPDATE post_version SET version = version + 1 WHERE id = 1; END"
+    for op in ("INSERT", "UPDATE", "DELETE")
+)
+
+def _migrate_schema(connection):
+    """Brings a posts.db created by an older version up to date; create_all() won't alter tables.
+
+    Each step keys off what is still left to do, so a migration that failed part way
+    through picks up where it stopped on the next start.
+    """
+    existing = {column['name'] for column in inspect(connection).get_columns('post')}
+    if 'updated_at' in existing:
+        # Added for an ETag that post_version has since replaced; nothing reads it
+        connection.execute(text("ALTER TABLE post DROP COLUMN updated_at"))
+    if 'scheduled_ts' not in existing:
+        connection.execute(text("ALTER TABLE post ADD COLUMN scheduled_ts BIGINT"))
+    if 'scheduled_time' in existing:
+        # scheduled_time holds naive IST wall-clock times; strftime('%s') reads them as UTC
+        connection.execute(
+            text(
+                "UPDATE post SET scheduled_ts = CAST(strftime('%s', scheduled_time) AS INTEGER) - :offset "
+                "WHERE scheduled_ts IS NULL"
+            ),
+            {"offset": int(IST.utcoffset(None).total_seconds())}
+        )
+        # SQLite (3.35+) only drops a column once no index refers to it
+        connection.execute(text("DROP INDEX IF EXISTS ix_post_status_time"))
+        connection.execute(text("DROP INDEX IF EXISTS ix_post_scheduled_time"))
+        connection.execute(text("ALTER TABLE post DROP COLUMN scheduled_time"))
+    for statement in POST_VERSION_DDL:
+        connection.execute(text(statement))
+
+def _setup_database():
+    """Creates, migrates and indexes the schema in a single BEGIN IMMEDIATE transaction.
+
+    pysqlite would otherwise autocommit each ALTER TABLE on its own, and the immediate
+    lock makes a web and a scheduler process starting together take turns.
+    """
+    with _write_lock, write_engine.connect() as connection:
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+        db.metadata.create_all(connection)
+        _migrate_schema(connection)
+        # create_all() skips indexes on tables that already exist
+        for index in Post.__table__.indexes:
+            index.create(connection, checkfirst=True)
+        connection.commit()
+
 # ---------- Scheduler (persistent job store) ----------
+# Jobs get their own database file: APScheduler commits outside _write_lock, so sharing
+# posts.db would make every job write contend with post writes for the same lock.
 jobstores = {'default': SQLAlchemyJobStore(url='sqlite:///jobs.db')}
-scheduler = BackgroundScheduler(jobstores=jobstores, timezone=IST)
-scheduler.start()
+_enable_sqlite_wal(jobstores['default'].engine)
+# eventlet.monkey_patch() makes these pool threads green, and sqlite3 calls block the hub,
+# so jobs don't run in parallel; the pool just lets due jobs queue without waiting on a thread
+executors = {'default': APSThreadPool(max_workers=8)}
+job_defaults = {
+    'coalesce': True,          # Fires missed while the process was down run once, not once each
+    'max_instances': 1,
+    'misfire_grace_time': 300  # Still publish a post up to 5 minutes late instead of dropping it
+}
+# Longest the scheduler thread sleeps between checks for due jobs
+SCHEDULER_MAX_WAIT = 3600
+
+class EventletBackgroundScheduler(BackgroundScheduler):
+    """BackgroundScheduler whose waits stay within what eventlet's hub can poll for.
+
+    APScheduler waits up to threading.TIMEOUT_MAX when it is paused at start or the next
+    job is far off. Under monkey_patch() that becomes a hub timer, and the hub's epoll call
+    rejects it ("timeout is too large") once no other timer is sooner, e.g. while
+    `python app.py` idles between requests.
+    """
+
+    def _main_loop(self):
+        wait_seconds = SCHEDULER_MAX_WAIT
+        while self.state != STATE_STOPPED:
+            self._event.wait(wait_seconds)
+            self._event.clear()
+            wait_seconds = self._process_jobs()
+            if wait_seconds is not None:
+                wait_seconds = min(wait_seconds, SCHEDULER_MAX_WAIT)
+
+# Started by init_scheduler(), after its startup pass has queued the upcoming posts
+scheduler = EventletBackgroundScheduler(
+    jobstores=jobstores, executors=executors, job_defaults=job_defaults, timezone=IST
+)
 
 def _job_id(post_id: int) -> str:
     """Generates a consistent job ID for a post."""
     return f"post_{post_id}"
 
+def _room(post_id: int) -> str:
+    """Socket.IO room that receives status updates for a post."""
+    return f"post_{post_id}"
+
+def _emit_posted(post_ids):
+    """Tells the clients watching each post that it has been published."""
+    for post_id in post_ids:
+        socketio.emit("status_update", {"post_id": post_id, "status": "posted"}, to=_room(post_id))
+
 # ---------- Scheduler Job Function ----------
 def publish_post(post_id: int):
     """Job invoked by APScheduler to 'publish' a post."""
     with app.app_context():
-        post = Post.query.get(post_id)
-        if not post:
-            logging.warning(f"[publish_post] Post with id={post_id} not found.")
+        # Mark as posted only if still scheduled, in one statement (SQLite 3.35+ for RETURNING)
+        with _write_transaction() as session:
+            row = session.execute(
+                update(Post)
+                .where(Post.id == post_id, Post.status == "scheduled")
+                .values(status="posted")
+                .returning(Post.id)
+                .execution_options(synchronize_session=False)
+            ).first()
+        if row is None:
+            logging.info(f"[publish_post] Post id={post_id} not found or not in 'scheduled' state. Skipping.")
             return
-        if post.status != "scheduled":
-            logging.info(f"[publish_post] Post id={post_id} is not in 'scheduled' state (current: {post.status}). Skipping.")
-            return
-        
-        # Mark as posted
-        post.status = "posted"
-        db.session.commit()
-        
-        # Emit socket event to notify connected clients
-        socketio.emit("status_update", {"post_id": post.id, "status": "posted"})
+
+        # Emit on the eventlet hub so this scheduler thread doesn't wait on the client fan-out
+        socketio.start_background_task(_emit_posted, [post_id])
         logging.info(f"📢 [publish_post] Post id={post_id} marked as 'posted' at {datetime.now(IST)}")
 
-# ---------- Scheduler Setup (run once at startup) ----------
-with app.app_context():
-    db.create_all()
-    scheduled_posts = Post.query.filter_by(status="scheduled").all()
-    logging.info(f"Found {len(scheduled_posts)} scheduled posts to process at startup.")
-    for post in scheduled_posts:
-        run_time = post.scheduled_time
-        # Ensure datetime is timezone-aware
-        if run_time.tzinfo is None:
-            run_time = run_time.replace(tzinfo=IST)
-
-        # If scheduled time has passed, run the job immediately
-        if run_time <= datetime.now(IST):
-            logging.info(f"Post id={post.id} scheduled time is in the past. Publishing immediately.")
-            publish_post(post.id)
-        else:
-            # Schedule the job
+# ---------- Database Setup (run once at import) ----------
+_setup_database()
+
+# ---------- Scheduler Setup ----------
+SCHEDULER_POLL_SECONDS = 30
+
+def init_scheduler(app, paused=False):
+    """Starts the scheduler in this process.
+
+    With paused=True the scheduler only stores jobs for another process to run.
+    Otherwise overdue posts are published, upcoming ones are queued, and jobs run here;
+    a scheduler already started paused at import is resumed.
+    """
+    if paused:
+        scheduler.start(paused=True)
+        return
+
+    with app.app_context():
+        scheduled_posts = db.session.query(Post.id, Post.scheduled_ts).filter(Post.status == "scheduled").all()
+        logging.info(f"Found {len(scheduled_posts)} scheduled posts to process at startup.")
+        now_ts = datetime.now(IST).timestamp()
+        overdue_ids = []
+        upcoming = []
+        for post_id, scheduled_ts in scheduled_posts:
+            if scheduled_ts <= now_ts:
+                overdue_ids.append(post_id)
+            else:
+                upcoming.append((post_id, datetime.fromtimestamp(scheduled_ts, IST)))
+
+        # Publish every post whose scheduled time has passed in a single UPDATE
+        if overdue_ids:
+            with _write_transaction():
+                Post.query.filter(Post.id.in_(overdue_ids), Post.status == "scheduled").update(
+                    {Post.status: "posted"}, synchronize_session=False
+                )
+            # Clients can only be subscribed before the scheduler starts if they're
+            # connected to other web processes, which are reached through the queue
+            if SOCKETIO_MESSAGE_QUEUE:
+                socketio.start_background_task(_emit_posted, overdue_ids)
+            logging.info(f"Published {len(overdue_ids)} posts whose scheduled time had passed.")
+
+        # Until the scheduler starts these are only queued in memory; a paused one stores them now
+        for post_id, run_time in upcoming:
             try:
                 scheduler.add_job(
                     func=publish_post,
                     trigger='date',
                     run_date=run_time,
-                    args=[post.id],
-                    id=_job_id(post.id),
+                    args=[post_id],
+                    id=_job_id(post_id),
                     replace_existing=True
                 )
-                logging.info(f"Scheduled job for post id={post.id} at {run_time.strftime('%Y-%m-%d %H:%M:%S')}")
+                logging.info(f"Scheduled job for post id={post_id} at {run_time.strftime('%Y-%m-%d %H:%M:%S')}")
             except Exception as e:
-                logging.error(f"[SchedulerSetup] Failed to add job for post {post.id}: {e}")
+                logging.error(f"[SchedulerSetup] Failed to add job for post {post_id}: {e}")
+
+    if scheduler.running:
+        scheduler.resume()
+    else:
+        # Writes the queued jobs to the jobstore in one pass before the first wakeup
+        scheduler.start()
+
+def run_scheduler():
+    """Runs the process that publishes posts when web workers use SCHEDULER_ROLE=web.
+
+    Started as `python app.py run-scheduler` rather than a flask CLI command, since
+    `flask` imports werkzeug and click before this module can monkey-patch for eventlet.
+    """
+    if SCHEDULER_ROLE:
+        sys.exit("Unset SCHEDULER_ROLE for the scheduler process.")
+    init_scheduler(app)
+    while True:
+        # Jobs written by web workers are only noticed on the next wakeup
+        time.sleep(SCHEDULER_POLL_SECONDS)
+        scheduler.wakeup()
+
+# ---------- Uploads ----------
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+def _remove_image(filename: str, context: str):
+    """Deletes an uploaded image, treating one that is already gone as removed."""
+    image_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    try:
+        os.unlink(image_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.error(f"[{context}] Failed to remove image file {image_path}: {e}")
+
+def _write_image(stream, image_path: str):
+    """Copies an upload to a temporary file beside image_path, then renames it into place."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(image_path), suffix='.part')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            shutil.copyfileobj(stream, f, length=UPLOAD_CHUNK_SIZE)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates 0600 files
+        os.replace(tmp_path, image_path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+def _save_image(image_file, filename: str):
+    """Streams an uploaded image into UPLOAD_FOLDER in fixed-size chunks.
+
+    The disk writes run on eventlet's native thread pool, so the hub keeps serving other
+    requests meanwhile. This request still waits for them, so the image is in place under
+    its final name before the row naming it is committed, and never half-written.
+    """
+    image_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    tpool.execute(_write_image, image_file.stream, image_path)
 
 # ---------- Routes ----------
+POSTS_PER_PAGE = 50
+
+@app.template_filter('to_ist_str')
+def to_ist_str(ts: int, fmt: str = '%b %d, %Y %I:%M %p') -> str:
+    """Formats stored unix seconds as IST wall-clock time."""
+    return datetime.fromtimestamp(ts, IST).strftime(fmt)
+
+# Columns rendered by index.html; rows come back as plain tuples, skipping ORM hydration
+INDEX_COLUMNS = (
+    Post.id, Post.title, Post.content, Post.platform,
+    Post.scheduled_ts, Post.status, Post.image_filename,
+)
+
+# Changes on every start, so a deploy with new templates or a recreated posts.db (whose
+# version restarts at 0) never matches an ETag a browser kept from before
+BOOT_ID = uuid.uuid4().hex[:8]
+
+def _posts_etag() -> str:
+    """Version of the post table; changes whenever a post is added, edited, published or deleted."""
+    version = db.session.execute(text("SELECT version FROM post_version WHERE id = 1")).scalar()
+    return f"{BOOT_ID}-{version}"
+
 @app.route('/')
 def index():
-    posts = Post.query.order_by(Post.scheduled_time.desc()).all()
-    return render_template("index.html", posts=posts)
+    page = request.args.get('page', 1, type=int)
+    etag = _posts_etag()
+    if request.if_none_match.contains_weak(etag):
+        # The client's copy is current: answer before touching the cache, the listing or the template
+        response = make_response('', 304)
+    else:
+        cache_key = f"index:{page}:{etag}"
+        html = cache.get(cache_key)
+        if html is None:
+            pagination = db.session.query(*INDEX_COLUMNS).order_by(Post.scheduled_ts.desc()).paginate(
+                page=page, per_page=POSTS_PER_PAGE, error_out=False
+            )
+            # Past the last page (e.g. after deletions): send the user to the last page that has posts
+            if not pagination.items and pagination.total:
+                return redirect(url_for('index', page=pagination.pages))
+            html = render_template("index.html", posts=pagination.items, pagination=pagination)
+            cache.set(cache_key, html)
+        response = make_response(html)
+
+    response.set_etag(etag)
+    response.cache_control.no_cache = True  # Always revalidate; unchanged pages come back as 304
+    return response
 
 @app.route('/schedule', methods=['GET', 'POST'])
 def schedule():
@@ -108,9 +434,9 @@ def schedule():
         content = request.form['content']
         platform = request.form['platform']
         
-        # Parse datetime from form and make it timezone-aware
+        # Parse datetime from form (datetime-local sends ISO 8601) and make it timezone-aware
         scheduled_time_str = request.form['scheduled_time']
-        scheduled_time = datetime.strptime(scheduled_time_str, "%Y-%m-%dT%H:%M").replace(tzinfo=IST)
+        scheduled_time = datetime.fromisoformat(scheduled_time_str).replace(tzinfo=IST)
 
         # Handle image upload
         image_filename = None
@@ -118,15 +444,15 @@ def schedule():
             image_file = request.files['image']
             if image_file.filename != '':
                 image_filename = secure_filename(image_file.filename)
-                image_file.save(os.path.join(app.config['UPLOAD_FOLDER'], image_filename))
+                _save_image(image_file, image_filename)
 
         # Save to DB
         new_post = Post(
             title=title, content=content, platform=platform,
-            scheduled_time=scheduled_time, image_filename=image_filename
+            scheduled_ts=int(scheduled_time.timestamp()), image_filename=image_filename
         )
-        db.session.add(new_post)
-        db.session.commit()
+        with _write_transaction() as session:
+            session.add(new_post)
 
         # Schedule the job
         try:
@@ -145,36 +471,48 @@ def schedule():
 def edit(id):
     post = Post.query.get_or_404(id)
     if request.method == 'POST':
-        post.title = request.form['title']
-        post.content = request.form['content']
-        post.platform = request.form['platform']
-        post.scheduled_time = datetime.strptime(request.form['scheduled_time'], "%Y-%m-%dT%H:%M").replace(tzinfo=IST)
+        scheduled_time = datetime.fromisoformat(request.form['scheduled_time']).replace(tzinfo=IST)
 
         # Handle optional image replacement
+        image_filename = post.image_filename
         if 'image' in request.files:
             image_file = request.files['image']
             if image_file.filename != '':
-                # Optionally remove the old image
-                if post.image_filename:
-                    old_image_path = os.path.join(app.config['UPLOAD_FOLDER'], post.image_filename)
-                    if os.path.exists(old_image_path):
-                        os.remove(old_image_path)
-                
-                new_filename = secure_filename(image_file.filename)
-                image_file.save(os.path.join(app.config['UPLOAD_FOLDER'], new_filename))
-                post.image_filename = new_filename
-
-        db.session.commit()
-
-        # Reschedule the job
-        try:
-            scheduler.add_job(
-                func=publish_post, trigger='date', run_date=post.scheduled_time,
-                args=[post.id], id=_job_id(post.id), replace_existing=True
-            )
-            logging.info(f"[Edit] Successfully rescheduled job for post id={post.id}")
-        except Exception as e:
-            logging.error(f"[Edit] Failed to reschedule job for post {post.id}: {e}")
+                image_filename = secure_filename(image_file.filename)
+                _save_image(image_file, image_filename)
+
+        # Only write the fields that actually changed; an unchanged form costs no commit at all
+        proposed = {
+            'title': request.form['title'],
+            'content': request.form['content'],
+            'platform': request.form['platform'],
+            'scheduled_ts': int(scheduled_time.timestamp()),
+            'image_filename': image_filename,
+        }
+        changes = {field: value for field, value in proposed.items() if getattr(post, field) != value}
+        if not changes:
+            logging.info(f"[Edit] No changes for post id={post.id}")
+            return redirect(url_for('index'))
+
+        old_image = post.image_filename
+        with _write_transaction():
+            for field, value in changes.items():
+                setattr(post, field, value)
+
+        # Remove the replaced image only once the committed row no longer points at it
+        if 'image_filename' in changes and old_image:
+            _remove_image(old_image, "Edit")
+
+        # Reschedule the job if its run time moved
+        if 'scheduled_ts' in changes:
+            try:
+                scheduler.add_job(
+                    func=publish_post, trigger='date', run_date=scheduled_time,
+                    args=[post.id], id=_job_id(post.id), replace_existing=True
+                )
+                logging.info(f"[Edit] Successfully rescheduled job for post id={post.id}")
+            except Exception as e:
+                logging.error(f"[Edit] Failed to reschedule job for post {post.id}: {e}")
 
         return redirect(url_for('index'))
     return render_template("edit.html", post=post)
@@ -193,26 +531,62 @@ def delete(id):
 
     # Remove uploaded image file
     if post.image_filename:
-        image_path = os.path.join(app.config['UPLOAD_FOLDER'], post.image_filename)
-        if os.path.exists(image_path):
-            try:
-                os.remove(image_path)
-            except Exception as e:
-                logging.error(f"[Delete] Failed to remove image file {image_path}: {e}")
+        _remove_image(post.image_filename, "Delete")
 
     # Delete from DB
-    db.session.delete(post)
-    db.session.commit()
+    with _write_transaction() as session:
+        session.delete(post)
     
     return redirect(url_for('index'))
 
 # Serve uploaded images
 @app.route('/uploads/<filename>')
 def uploaded_file(filename):
+    accel_prefix = app.config['UPLOADS_ACCEL_REDIRECT']
+    if accel_prefix:
+        # Uploads are always stored under secure_filename(), so anything else can't exist
+        if secure_filename(filename) != filename:
+            abort(404)
+        response = make_response('')
+        response.headers['X-Accel-Redirect'] = f"{accel_prefix.rstrip('/')}/{filename}"
+        response.mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        return response
     return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
 
+# ---------- Socket Events ----------
+@socketio.on('subscribe')
+def subscribe(data):
+    """Joins the client to the rooms of the posts it is displaying."""
+    if not isinstance(data, dict) or not isinstance(data.get('post_ids'), list):
+        return
+    for post_id in data['post_ids']:
+        # bool is a subclass of int, but True/False are not post ids
+        if isinstance(post_id, int) and not isinstance(post_id, bool):
+            join_room(_room(post_id))
+
+# ---------- Scheduler Role ----------
+# Importing this module (tests, flask shell, gunicorn --preload) never runs jobs on its own.
+# gunicorn workers opt in with SCHEDULER_ROLE:
+#   embedded - run jobs in the web process (a single worker, no scheduler process)
+#   web      - only store jobs; `python app.py run-scheduler` runs them in one dedicated process
+# Unset (flask run, plain gunicorn, a host's own start command) stores jobs like web, so
+# none are lost; `python app.py` and `python app.py run-scheduler` then resume the scheduler.
+SCHEDULER_ROLE = os.environ.get("SCHEDULER_ROLE")
+if SCHEDULER_ROLE == "embedded":
+    init_scheduler(app)
+else:
+    init_scheduler(app, paused=True)
+    if not SCHEDULER_ROLE:
+        logging.warning("SCHEDULER_ROLE is unset: jobs are stored in jobs.db but only run once a "
+                        "scheduler process starts (`python app.py` or `python app.py run-scheduler`).")
+
 # ---------- Run App ----------
-if __name__ == '__main__':
+def main():
+    """Entry point for `python app.py` and `python app.py run-scheduler`."""
+    if sys.argv[1:] == ['run-scheduler']:
+        run_scheduler()
+    if not SCHEDULER_ROLE:
+        init_scheduler(app)
     # Use debug=False to prevent the Flask dev reloader from running the scheduler twice
     port = int(os.environ.get("PORT", 5000))  # ✅ Render provides PORT env var
     socketio.run(app, host="0.0.0.0", port=port, debug=False)